@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-18 12:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('djilsiHome', '0003_storelastids_watermark'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='storedata',
+            name='instaMediaVariants',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
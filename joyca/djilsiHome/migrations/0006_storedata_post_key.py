@@ -0,0 +1,42 @@
+# Generated by Django 5.1.15 on 2026-10-18 12:27
+
+from django.db import migrations, models
+
+# platform -> storeData column holding the platform's own ID
+KEY_FIELDS = {"YouTube": "videoIdYT", "Instagram": "instaPostID", "Twitter": "twitterPostID"}
+
+
+def fill_post_keys(apps, schema_editor):
+    storeData = apps.get_model("djilsiHome", "storeData")
+    for platform, field in KEY_FIELDS.items():
+        storeData.objects.filter(platform=platform).update(postKey=models.F(field))
+    storeData.objects.filter(postKey="").update(postKey=None)
+    # repeated inserts left duplicates behind; keep the latest copy of each post
+    duplicates = (storeData.objects.exclude(postKey=None).values("platform", "postKey")
+                  .annotate(copies=models.Count("sno"), keep=models.Max("sno")).filter(copies__gt=1))
+    for row in duplicates:
+        storeData.objects.filter(platform=row["platform"], postKey=row["postKey"]).exclude(sno=row["keep"]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('djilsiHome', '0005_feed_keyset'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='storedata',
+            name='postKey',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.RunPython(fill_post_keys, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='storedata',
+            index=models.Index(fields=['platform', 'publishDateYT'], name='djilsi_platform_pub_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='storedata',
+            constraint=models.UniqueConstraint(fields=('platform', 'postKey'), name='djilsi_post_key_uniq'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-18 12:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('djilsiHome', '0006_storedata_post_key'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='storedata',
+            name='fingerprint',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+    ]
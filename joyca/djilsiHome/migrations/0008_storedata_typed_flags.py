@@ -0,0 +1,46 @@
+# Generated by Django 5.1.15 on 2026-10-18 12:29
+
+from django.db import migrations, models
+
+FLAGS = ["instaIsVideo", "instaIsSingle", "twitterIsVideo"]
+
+
+def flags_to_digits(apps, schema_editor):
+    # "True"/"False" strings become 1/0, which every backend casts to a boolean
+    storeData = apps.get_model("djilsiHome", "storeData")
+    for flag in FLAGS:
+        storeData.objects.filter(**{flag: "True"}).update(**{flag: "1"})
+        storeData.objects.exclude(**{flag: "1"}).update(**{flag: "0"})
+
+
+def digits_to_flags(apps, schema_editor):
+    storeData = apps.get_model("djilsiHome", "storeData")
+    for flag in FLAGS:
+        storeData.objects.filter(**{flag + "__in": ["1", "true"]}).update(**{flag: "True"})
+        storeData.objects.exclude(**{flag: "True"}).update(**{flag: "False"})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('djilsiHome', '0007_storedata_fingerprint'),
+    ]
+
+    operations = [
+        migrations.RunPython(flags_to_digits, digits_to_flags),
+        migrations.AlterField(
+            model_name='storedata',
+            name='instaIsSingle',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AlterField(
+            model_name='storedata',
+            name='instaIsVideo',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AlterField(
+            model_name='storedata',
+            name='twitterIsVideo',
+            field=models.BooleanField(default=False),
+        ),
+    ]
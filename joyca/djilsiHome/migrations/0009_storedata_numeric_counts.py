@@ -0,0 +1,82 @@
+# Generated by Django 5.1.15 on 2026-10-18 12:31
+
+from django.db import migrations, models
+
+COUNTS = ["viewsYT", "instaLikes", "twitterLikes"]
+SUFFIXES = {"K": 1000, "M": 1000000}
+
+
+def parse_count(text):
+    # "12.5K" -> 12500; the exact figure comes back with the next refresh
+    text = (text or "").strip().replace(",", "")
+    multiplier = SUFFIXES.get(text[-1:].upper(), 1)
+    if multiplier > 1:
+        text = text[:-1]
+    try:
+        return round(float(text) * multiplier)
+    except ValueError:
+        return 0
+
+
+def format_count(count):
+    count = int(count or 0)
+    if count >= 1000000:
+        return f"{round(count / 1000000, 2)}M"
+    if count >= 1000:
+        return f"{round(count / 1000, 2)}K"
+    return str(count)
+
+
+def rewrite(apps, convert):
+    storeData = apps.get_model("djilsiHome", "storeData")
+    rows = list(storeData.objects.only("sno", *COUNTS))
+    for row in rows:
+        for field in COUNTS:
+            setattr(row, field, str(convert(getattr(row, field))))
+    storeData.objects.bulk_update(rows, COUNTS, batch_size=500)
+
+
+def counts_to_digits(apps, schema_editor):
+    rewrite(apps, parse_count)
+
+
+def digits_to_counts(apps, schema_editor):
+    rewrite(apps, format_count)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('djilsiHome', '0008_storedata_typed_flags'),
+    ]
+
+    operations = [
+        migrations.RunPython(counts_to_digits, digits_to_counts),
+        migrations.AlterField(
+            model_name='storedata',
+            name='instaLikes',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='storedata',
+            name='twitterLikes',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='storedata',
+            name='viewsYT',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='storedata',
+            index=models.Index(fields=['platform', 'viewsYT'], name='djilsi_yt_views_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='storedata',
+            index=models.Index(fields=['platform', 'instaLikes'], name='djilsi_insta_likes_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='storedata',
+            index=models.Index(fields=['platform', 'twitterLikes'], name='djilsi_tw_likes_idx'),
+        ),
+    ]
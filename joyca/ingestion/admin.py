@@ -0,0 +1,7 @@
+from django.contrib import admin
+from .models import *
+# Register your models here.
+admin.site.register(MediaBlob)
+admin.site.register(MediaSource)
+admin.site.register(IngestRun)
+admin.site.register(NitterInstance)
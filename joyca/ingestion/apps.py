@@ -0,0 +1,18 @@
+from django.apps import AppConfig
+
+
+class IngestionConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'ingestion'
+
+    def ready(self):
+        from django.db.models.signals import post_delete, post_save
+
+        from .brands import BRANDS
+        from .profiles import PROFILES, invalidate
+
+        for brand in BRANDS.values():
+            for model in PROFILES.values():
+                sender = brand.model(model)
+                post_save.connect(invalidate, sender=sender, dispatch_uid=f"profiles-save-{sender._meta.label}")
+                post_delete.connect(invalidate, sender=sender, dispatch_uid=f"profiles-delete-{sender._meta.label}")
@@ -0,0 +1,96 @@
+import hashlib
+import logging
+import os
+from urllib.parse import urlsplit
+
+from django.conf import settings
+
+from .downloads import CHUNK_SIZE, MediaJob
+from .models import MediaBlob, MediaSource
+
+logger = logging.getLogger(__name__)
+
+BLOB_FOLDER = "static/instagram/blobs"
+BLOB_URL = settings.STATIC_URL + "instagram/blobs/"
+
+
+def source_key(url):
+    # CDN URLs carry short-lived signatures in the query string; the path is
+    # what identifies the asset.
+    parts = urlsplit(url)
+    return (parts.netloc.split(".", 1)[-1] + parts.path)[:255]
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BlobStore:
+    """
+    Content-addressed media store shared by every brand app.
+
+    Files live once under ``static/instagram/blobs/<aa>/<sha256><ext>``
+    whatever post or brand referenced them. ``MediaSource`` maps upstream
+    URLs onto blobs so a URL seen before is not downloaded again.
+
+    Usage: ``add()`` every URL, download ``jobs()`` on a DownloadPool,
+    ``commit()`` the pool summary, then read ``url()`` for each URL.
+
+    Downloads are staged per ``owner`` (the brand): brands ingest
+    concurrently and may reference the same URL, while one brand's later
+    run still finds, and resumes, the partial file its last run left.
+    """
+
+    def __init__(self, owner):
+        self.owner = owner
+        self._wanted = {}
+        self._urls = {}
+        self._jobs = None
+
+    def add(self, url, ext, key):
+        self._wanted.setdefault(source_key(url), (url, ext, key))
+
+    def jobs(self):
+        # one IN query resolves every URL already in the store
+        known = MediaSource.objects.filter(sourceKey__in=list(self._wanted)).select_related("blob")
+        for source in known:
+            if os.path.exists(os.path.join(settings.BASE_DIR, BLOB_FOLDER, source.blob.path)):
+                self._urls[source.sourceKey] = BLOB_URL + source.blob.path
+        self._jobs = {}
+        for sourceKey, (url, ext, key) in self._wanted.items():
+            if sourceKey in self._urls:
+                continue
+            staging = hashlib.sha1(f"{self.owner}/{sourceKey}".encode()).hexdigest() + ext
+            self._jobs[sourceKey] = MediaJob(url, staging, f"{BLOB_FOLDER}/incoming", key)
+        return list(self._jobs.values())
+
+    def commit(self, summary):
+        for sourceKey, job in self._jobs.items():
+            staging = os.path.join(settings.BASE_DIR, job.folder, job.filename)
+            if not os.path.exists(staging):
+                continue
+            sha256 = file_sha256(staging)
+            path = f"{sha256[:2]}/{sha256}{os.path.splitext(job.filename)[1]}"
+            final = os.path.join(settings.BASE_DIR, BLOB_FOLDER, path)
+            if os.path.exists(final):
+                os.remove(staging)
+            else:
+                os.makedirs(os.path.dirname(final), exist_ok=True)
+                os.replace(staging, final)
+            blob, created = MediaBlob.objects.get_or_create(
+                sha256=sha256, defaults={"path": path, "size": os.path.getsize(final)}
+            )
+            if not created:
+                summary.deduplicated += 1
+            MediaSource.objects.update_or_create(sourceKey=sourceKey, defaults={"blob": blob})
+            self._urls[sourceKey] = BLOB_URL + blob.path
+        summary.storeHits = len(self._wanted) - len(self._jobs)
+        logger.info("blob store: %s hits, %s duplicates", summary.storeHits, summary.deduplicated)
+
+    def url(self, url):
+        """Returns the static URL the bytes of ``url`` are served from, or None."""
+        return self._urls.get(source_key(url))
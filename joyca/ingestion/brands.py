@@ -0,0 +1,75 @@
+from collections import namedtuple
+
+from django.apps import apps
+
+
+class Brand(namedtuple("Brand", [
+    "key",
+    "app",
+    "displayName",
+    "youtubeChannelID",
+    "youtubeLink",
+    "youtubeAvatar",
+    "instagramUsername",
+    "instagramPicture",
+    "twitterUsername",
+    "twitterHandle",
+])):
+    """
+    One site fed by the ingestion engine.
+
+    ``app`` is the Django app holding the brand's tables (storeData,
+    bannerYT, dpInsta, ...); everything else is the upstream identity the
+    fetchers need.
+    """
+
+    def model(self, name):
+        return apps.get_model(self.app, name)
+
+    @property
+    def instagramLink(self):
+        return f"https://www.instagram.com/{self.instagramUsername}/"
+
+    @property
+    def twitterLink(self):
+        return f"https://twitter.com/{self.twitterUsername}"
+
+
+BRANDS = {brand.key: brand for brand in [
+    Brand(
+        key="joyca",
+        app="joycaHome",
+        displayName="Joyca",
+        youtubeChannelID="UCow2IGnug1l3Xazkrc5jM_Q",
+        youtubeLink="https://www.youtube.com/@Joyca",
+        youtubeAvatar="https://unavatar.io/youtube/joyca",
+        instagramUsername="joyca",
+        instagramPicture="instagram.jpg",
+        twitterUsername="joycaoff",
+        twitterHandle="Joycaoff",
+    ),
+    Brand(
+        key="djilsi",
+        app="djilsiHome",
+        displayName="Djilsi",
+        youtubeChannelID="UCEUZRSYr1a2hnBfnpWslFeQ",
+        youtubeLink="https://www.youtube.com/@Djilsi",
+        youtubeAvatar="https://unavatar.io/youtube/DJILSI",
+        instagramUsername="djilsi",
+        instagramPicture="instagram-djilsi.jpg",
+        twitterUsername="djilsi",
+        twitterHandle="Djilsi",
+    ),
+    Brand(
+        key="pannacotech",
+        app="pannacotechHome",
+        displayName="Pannacotech",
+        youtubeChannelID="UCZO7iTy_uLmPbZiofPJpeXA",
+        youtubeLink="https://www.youtube.com/@pannacotech",
+        youtubeAvatar="https://unavatar.io/youtube/pannacotech",
+        instagramUsername="pannacotech",
+        instagramPicture="instagram-pannacotech.jpg",
+        twitterUsername="pannacotech",
+        twitterHandle="Pannacotech",
+    ),
+]}
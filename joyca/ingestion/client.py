@@ -0,0 +1,123 @@
+import logging
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from . import metrics, ratelimit
+
+logger = logging.getLogger(__name__)
+
+_session = None
+_lock = threading.Lock()
+
+
+class UpstreamError(Exception):
+    """An upstream answered with a status the fetcher cannot use; fails the stage."""
+
+
+class PacedRetry(Retry):
+    # every throttled attempt slows the host down for all threads, not only
+    # the one retrying, and the retry itself waits on the host's bucket
+    host = None
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        host = _pool.host if _pool is not None else None
+        if host and (response is None or response.status in ratelimit.THROTTLE_STATUSES):
+            ratelimit.bucket_for(host).penalise(ratelimit.retry_after(response.headers if response else None))
+        retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        retry.host = host
+        return retry
+
+    def sleep(self, response=None):
+        if self.host is None:
+            return super().sleep(response)
+        # penalise() blocked the bucket for the Retry-After or backoff; the
+        # retry takes a token like any other request once that has passed
+        ratelimit.bucket_for(self.host).acquire()
+
+
+class PacedAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that takes a token from the host's bucket before every
+    request; the retries inside ``send`` take theirs in PacedRetry.sleep.
+    """
+
+    def send(self, request, **kwargs):
+        bucket = ratelimit.bucket_for(urlsplit(request.url).hostname)
+        bucket.acquire()
+        response = super().send(request, **kwargs)
+        # throttled attempts were already reported by PacedRetry
+        if response.status_code not in ratelimit.THROTTLE_STATUSES:
+            bucket.succeeded()
+        return response
+
+
+def session():
+    """
+    Returns the process wide ``requests.Session`` used for every upstream call.
+
+    Connections are kept alive and pooled per host, so the Graph API, the
+    YouTube endpoints and the Instagram CDN each pay for a TCP+TLS handshake
+    once per pool slot instead of once per request. Idempotent requests are
+    retried with exponential backoff on connection errors and 429/5xx, and
+    paced per host by ``ratelimit`` so raising concurrency does not get us
+    banned.
+    """
+    global _session
+    with _lock:
+        if _session is None:
+            retry = PacedRetry(
+                total=settings.INGEST_HTTP_RETRIES,
+                backoff_factor=settings.INGEST_HTTP_BACKOFF,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset({"GET", "HEAD"}),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            )
+            adapter = PacedAdapter(
+                pool_connections=settings.INGEST_HTTP_POOL_HOSTS,
+                pool_maxsize=settings.INGEST_HTTP_POOL_SIZE,
+                max_retries=retry,
+            )
+            _session = requests.Session()
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+
+def get(url, **kwargs):
+    kwargs.setdefault("timeout", settings.INGEST_HTTP_TIMEOUT)
+    started = time.monotonic()
+    try:
+        return session().get(url, **kwargs)
+    finally:
+        metrics.current().fetched(time.monotonic() - started)
+
+
+def pool_stats():
+    """Per host connection reuse: ``{host: {"requests": n, "connections": m}}``."""
+    stats = {}
+    if _session is None:
+        return stats
+    seen = set()
+    for adapter in _session.adapters.values():
+        if id(adapter) in seen:
+            continue
+        seen.add(id(adapter))
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools[key]
+            host = stats.setdefault(pool.host, {"requests": 0, "connections": 0})
+            host["requests"] += pool.num_requests
+            host["connections"] += pool.num_connections
+    return stats
+
+
+def log_pool_stats():
+    for host, counts in pool_stats().items():
+        logger.info("%s: %s requests over %s connections", host, counts["requests"], counts["connections"])
@@ -0,0 +1,54 @@
+import hashlib
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from . import client
+from .models import UpstreamValidator
+
+# query parameters carrying credentials (YouTube API key, Graph API token)
+SECRET_PARAMS = ("key", "access_token")
+# a URL with a query string, absolute or (in urllib3's messages) just the path
+URL = re.compile(r"(?:https?://|/)[^\s'\"<>?]*\?[^\s'\"<>]+")
+
+
+def url_hash(url):
+    return hashlib.sha256(url.encode()).hexdigest()
+
+
+def redact(url):
+    """``url`` without its credential query parameters, for storing and display."""
+    parts = urlsplit(url)
+    query = [(name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True) if name not in SECRET_PARAMS]
+    return parts._replace(query=urlencode(query, safe="(){},/")).geturl()
+
+
+def redact_urls(text):
+    """``text`` (an exception message, say) with every URL in it redacted."""
+    return URL.sub(lambda match: redact(match.group()), text)
+
+
+def validator_for(url):
+    validator = UpstreamValidator.objects.filter(urlHash=url_hash(url)).first()
+    return validator or UpstreamValidator(urlHash=url_hash(url), url=redact(url))
+
+
+def conditional_get(url, **kwargs):
+    """
+    ``client.get`` that sends the stored ETag / Last-Modified for ``url``.
+
+    A 304 means nothing changed since the last remembered response and the
+    caller can skip parsing altogether. The validator travels on the
+    response; call ``remember()`` once the body has been processed so a
+    failed run does not turn the next one into a 304.
+    """
+    validator = validator_for(url)
+    headers = {**kwargs.pop("headers", {}), **validator.headers()}
+    response = client.get(url, headers=headers, **kwargs)
+    response.validator = validator
+    return response
+
+
+def remember(*responses):
+    for response in responses:
+        if response.status_code == 200 and response.validator.update(response):
+            response.validator.save()
@@ -0,0 +1,233 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+
+from . import client, metrics, ratelimit
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+# next to a .part file: the validators and length of the response it holds
+META_SUFFIX = ".meta"
+CONTENT_RANGE = re.compile(r"bytes (?:(\d+)-\d+|\*)/(\d+)")
+
+# per host semaphores, shared by every pool in the process so brands
+# ingesting side by side respect the same per host cap
+_hostSlots = {}
+_hostLock = threading.Lock()
+
+# One file to fetch. ``key`` groups the files that belong to the same row
+# (e.g. every child of a carousel) so the caller can tell which rows are
+# safe to write once the pool has finished. ``validator`` is an optional
+# UpstreamValidator that turns the request into a conditional GET.
+MediaJob = namedtuple(
+    "MediaJob", ["url", "filename", "folder", "key", "size", "sha256", "validator"], defaults=(None, None, None)
+)
+
+
+def download_video(url, filename, folder, size=None, sha256=None, validator=None):
+    """
+    Streams ``url`` to ``BASE_DIR/folder/filename``.
+
+    The body is written in chunks to ``filename.part`` and renamed into place
+    only once it is complete, so a crash never leaves a truncated file under
+    the final name. A leftover ``.part`` file is resumed with an HTTP Range
+    request, conditional (If-Range) on the validator of the response it came
+    from, and the finished file must match that response's length.
+    ``size`` and ``sha256`` are optional further checks.
+
+    With a ``validator`` the request is conditional: a 304 keeps the file on
+    disk, a 200 copies the new validators onto it for the caller to save
+    (no database access happens on the pool threads).
+
+    Returns:
+        The number of bytes in the file fetched (0 when the upstream answered
+        304), or None if the download failed.
+    """
+    directory = os.path.join(settings.BASE_DIR, folder)
+    os.makedirs(directory, exist_ok=True)
+    filenameDir = os.path.join(directory, filename)
+    partial = filenameDir + ".part"
+    meta = _read_meta(partial) if os.path.exists(partial) else None
+    if not (meta and (meta["etag"] or meta["lastModified"])):
+        # nothing tells whether upstream still serves the same bytes
+        meta = None
+        _discard(partial)
+    offset = os.path.getsize(partial) if os.path.exists(partial) else 0
+    headers = {}
+    if offset:
+        # a changed file comes back whole (200) instead of as the rest of another one
+        headers = {"Range": f"bytes={offset}-", "If-Range": meta["etag"] or meta["lastModified"]}
+    if validator is not None and not offset and os.path.exists(filenameDir):
+        headers.update(validator.headers())
+    try:
+        with client.get(url, headers=headers, stream=True) as response:
+            if response.status_code == 304:
+                return 0
+            if validator is not None and response.status_code == 200:
+                validator.update(response)
+            if response.status_code in (206, 416):
+                start, total = _content_range(response)
+                if total is None or total != meta["length"] or (response.status_code == 206 and start != offset):
+                    logger.warning("partial download of %s no longer matches upstream, discarding", url)
+                    _discard(partial)
+                    return None
+            if response.status_code == 416:
+                # the partial file already holds the whole body
+                pass
+            elif response.status_code in (200, 206):
+                if response.status_code == 200:
+                    meta = _write_meta(partial, response)
+                mode = 'ab' if response.status_code == 206 else 'wb'
+                with open(partial, mode) as f:
+                    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                        f.write(chunk)
+            else:
+                logger.warning("download of %s failed: status %s", url, response.status_code)
+                return None
+    except requests.RequestException as exc:
+        # keep the .part file, the next run resumes from it
+        logger.warning("download of %s failed: %s", url, exc)
+        return None
+    if size is None and meta:
+        size = meta["length"]
+    if not _verify(partial, size, sha256):
+        logger.warning("download of %s failed verification, discarding", url)
+        _discard(partial)
+        return None
+    os.replace(partial, filenameDir)
+    _discard(partial)
+    return os.path.getsize(filenameDir)
+
+
+def _read_meta(partial):
+    try:
+        with open(partial + META_SUFFIX) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_meta(partial, response):
+    """
+    Records what the ``.part`` file about to be written holds. A body sent
+    with a Content-Encoding is stored decoded, so its ranges and length do
+    not line up with the file: it gets no validators and is never resumed.
+    """
+    encoded = response.headers.get("Content-Encoding", "identity") != "identity"
+    length = response.headers.get("Content-Length")
+    meta = {
+        "etag": "" if encoded else response.headers.get("ETag", ""),
+        "lastModified": "" if encoded else response.headers.get("Last-Modified", ""),
+        "length": int(length) if length and length.isdigit() and not encoded else None,
+    }
+    with open(partial + META_SUFFIX, "w") as f:
+        json.dump(meta, f)
+    return meta
+
+
+def _content_range(response):
+    """``(first byte, total length)`` from Content-Range, None for what it leaves out."""
+    match = CONTENT_RANGE.fullmatch(response.headers.get("Content-Range", "").strip())
+    if not match:
+        return None, None
+    return int(match.group(1)) if match.group(1) else None, int(match.group(2))
+
+
+def _discard(partial):
+    for path in (partial, partial + META_SUFFIX):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _verify(path, size, sha256):
+    if size is not None and os.path.getsize(path) != size:
+        return False
+    if sha256 is not None:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                digest.update(chunk)
+        if digest.hexdigest() != sha256:
+            return False
+    return True
+
+
+class DownloadSummary:
+    def __init__(self):
+        self.files = 0
+        self.bytes = 0
+        self.failed = 0
+        self.elapsed = 0.0
+        self.failedKeys = set()
+        # filled in by BlobStore.commit()
+        self.storeHits = 0
+        self.deduplicated = 0
+
+    def merge(self, other):
+        # totals of a run made of several pools (one per page of posts)
+        for field in ("files", "bytes", "failed", "elapsed", "storeHits", "deduplicated"):
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+        self.failedKeys |= other.failedKeys
+
+    def __str__(self):
+        return (f"{self.files} files, {self.bytes} bytes, {self.failed} failed in {self.elapsed:.2f}s, "
+                f"{self.storeHits} store hits, {self.deduplicated} deduplicated")
+
+
+class DownloadPool:
+    """
+    Runs media downloads on a bounded thread pool.
+
+    ``workers`` caps the number of downloads in flight for this pool and
+    ``perHost`` caps them per upstream host across the whole process, so a
+    burst of carousel children does not open dozens of connections to the
+    same CDN edge.
+    """
+
+    def __init__(self, workers=None, perHost=None):
+        self.workers = workers or settings.INGEST_DOWNLOAD_WORKERS
+        self.perHost = perHost or settings.INGEST_DOWNLOAD_PER_HOST
+
+    def _slot(self, url):
+        host = urlsplit(url).netloc
+        with _hostLock:
+            if host not in _hostSlots:
+                _hostSlots[host] = threading.BoundedSemaphore(self.perHost)
+            return _hostSlots[host]
+
+    def _fetch(self, job):
+        with self._slot(job.url):
+            return job, download_video(job.url, job.filename, job.folder, job.size, job.sha256, job.validator)
+
+    def run(self, jobs):
+        summary = DownloadSummary()
+        started = time.monotonic()
+        if jobs:
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(jobs))) as executor:
+                for job, written in executor.map(self._fetch, jobs):
+                    if written is None:
+                        summary.failed += 1
+                        summary.failedKeys.add(job.key)
+                    else:
+                        summary.files += 1
+                        summary.bytes += written
+                        validator = job.validator
+                        if written and validator is not None and (validator.etag or validator.lastModified):
+                            validator.save()
+        summary.elapsed = time.monotonic() - started
+        logger.info("media downloads: %s", summary)
+        metrics.current().downloaded(summary)
+        client.log_pool_stats()
+        ratelimit.log_stats()
+        return summary
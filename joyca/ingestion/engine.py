@@ -0,0 +1,94 @@
+import logging
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection
+from django.utils.timezone import now
+
+from .brands import BRANDS
+from .conditional import redact_urls
+from .instagram import ingest_instagram
+from .metrics import count_queries, stage_metrics
+from .models import IngestRun
+from .twitter import ingest_twitter
+from .youtube import ingest_banner, ingest_youtube
+
+logger = logging.getLogger(__name__)
+
+# platform -> fetcher, in the order a brand runs them
+PLATFORMS = {
+    "twitter": ingest_twitter,
+    "youtube": ingest_youtube,
+    "banner": ingest_banner,
+    "instagram": ingest_instagram,
+}
+
+def run_stage(brand, platform, full=False):
+    """
+    Runs one fetcher for one brand; failures are reported, not raised.
+    Fetchers fail by raising, an unusable upstream status included
+    (``client.UpstreamError``).
+
+    Fetchers stop at the brand's watermark for the platform unless ``full``
+    asks them to walk (and refresh) everything upstream returns. Returns the
+    IngestRun logged for it.
+    """
+    started = time.monotonic()
+    ok = True
+    with stage_metrics() as stage, count_queries() as queries:
+        try:
+            status = PLATFORMS[platform](BRANDS[brand], full)
+        except Exception as exc:
+            # requests puts the full URL, API key or token included, in its messages
+            status = f"FAILED: {type(exc).__name__}: {redact_urls(str(exc))}"
+            logger.error("%s/%s %s\n%s", brand, platform, status, "".join(traceback.format_tb(exc.__traceback__)).rstrip())
+            ok = False
+            stage.errors += 1
+    elapsed = time.monotonic() - started
+    return IngestRun.objects.create(
+        brand=brand,
+        platform=platform,
+        ok=ok,
+        status=status[:255],
+        elapsed=elapsed,
+        fetches=stage.fetches,
+        fetchSeconds=stage.fetchSeconds,
+        downloadSeconds=stage.downloadSeconds,
+        dbSeconds=queries.seconds,
+        parseSeconds=max(elapsed - stage.fetchSeconds - stage.downloadSeconds - queries.seconds, 0),
+        queries=queries.count,
+        bytes=stage.bytes,
+        seen=stage.seen,
+        created=stage.created,
+        updated=stage.updated,
+        errors=stage.errors,
+    )
+
+
+def _run_brand(brand, platforms, full):
+    try:
+        return [run_stage(brand, platform, full) for platform in platforms]
+    finally:
+        # every worker thread opened its own connection
+        connection.close()
+
+
+def run(brands=None, platforms=None, full=False):
+    """
+    Ingests ``platforms`` for ``brands`` (default: everything registered).
+
+    Brands run side by side on INGEST_BRAND_WORKERS threads and share the
+    process wide HTTP pool, validator cache and blob store; the platforms of
+    one brand run in order.
+    """
+    brands = brands or list(BRANDS)
+    platforms = platforms or list(PLATFORMS)
+    with ThreadPoolExecutor(max_workers=min(settings.INGEST_BRAND_WORKERS, len(brands))) as executor:
+        results = executor.map(lambda brand: _run_brand(brand, platforms, full), brands)
+        runs = [result for brandResults in results for result in brandResults]
+    # the run log only has to cover what the metrics endpoint reports on
+    IngestRun.objects.filter(storeTime__lt=now() - timedelta(days=settings.INGEST_RUN_RETENTION_DAYS)).delete()
+    return runs
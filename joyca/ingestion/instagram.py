@@ -0,0 +1,196 @@
+from datetime import datetime
+from itertools import islice
+
+from django.conf import settings
+from django.db import transaction
+
+from . import client, metrics, pagecache, profiles, variants
+from .blobstore import BlobStore, source_key
+from .conditional import conditional_get, remember, validator_for
+from .cursors import advance, is_known, load_cursor
+from .downloads import DownloadPool, DownloadSummary, MediaJob
+from .upsert import write
+from .utils import format_count, is_image
+
+GRAPH_URL = 'https://graph.facebook.com/17841451041881672?fields=business_discovery.username({}){{{}}}&access_token={}'
+PROFILE_FIELDS = 'username,website,name,ig_id,id,profile_picture_url,biography,follows_count,followers_count,media_count'
+MEDIA_FIELDS = 'id,caption,like_count,comments_count,timestamp,username,media_product_type,media_type,owner,permalink,media_url,children{media_url}'
+
+
+def media_edge(limit, after=None):
+    # business_discovery pages its media edge through field modifiers, not query params
+    edge = f"media.after({after}).limit({limit})" if after else f"media.limit({limit})"
+    return edge + "{" + MEDIA_FIELDS + "}"
+
+
+def iter_media(username, accessToken, page, pageSize):
+    """
+    Yields the items of ``page`` (the media edge of a response already
+    fetched), then requests the following pages one at a time as the
+    consumer asks for more, so only one page is ever held in memory.
+    Stop iterating to stop paging.
+    """
+    while True:
+        yield from page.get("data", [])
+        after = page.get("paging", {}).get("cursors", {}).get("after")
+        if not page.get("data") or not after:
+            return
+        response = client.get(GRAPH_URL.format(username, media_edge(pageSize, after), accessToken))
+        response.raise_for_status()
+        page = response.json()["business_discovery"]["media"]
+
+
+def _unseen(cursor, items, full):
+    # newest first: everything from the watermark on is already stored
+    for media in items:
+        published = datetime.strptime(media["timestamp"], "%Y-%m-%dT%H:%M:%S%z")
+        if is_known(cursor, media["id"], published, full):
+            return
+        yield media, published
+
+
+def _parse(storeData, media, input_datetime):
+    instaIsSingle = False
+    videoURLInsta = None
+    mediaLinks = []
+    IsVideo = False
+    instaPostID = media["id"]
+
+    if media["media_product_type"] == "REELS" and media["media_type"] == "VIDEO":
+        IsVideo = True
+        videoURLInsta = media['media_url']
+    if media["media_product_type"] == "FEED" and media["media_type"] == "CAROUSEL_ALBUM":
+        IsVideo = False
+        instaIsSingle = False
+        for imLinks in media["children"]["data"]:
+            mediaLinks.append(imLinks["media_url"])
+    elif media["media_product_type"] == "FEED" and media["media_type"] == "IMAGE":
+        IsVideo = False
+        instaIsSingle = True
+        mediaLinks.append(media["media_url"])
+
+    postedTime = input_datetime.strftime("%Y-%m-%d %H:%M:%S.%U")
+    return storeData(
+        instaThumbnailURL = f'{instaPostID}.jpg',
+        instaIsVideo = IsVideo,
+        instaDesc = media["caption"],
+        instaPostID = instaPostID,
+        instaIsSingle = instaIsSingle,
+        platform = "Instagram",
+        publishDateYT = postedTime,
+        instaLikes = int(media["like_count"]),
+        instaPostLink = media["permalink"],
+        postKey = instaPostID
+    ), videoURLInsta, mediaLinks
+
+
+def _store_page(brand, storeData, posts, jobs):
+    """
+    Downloads the media of the new posts in ``posts`` (plus any extra
+    ``jobs``) and writes the new and changed posts, invalidating the brand's
+    cached pages in the same transaction. Returns ``(created, updated,
+    summary, complete)``; ``complete`` is False when a post was held back
+    because its media did not download.
+    """
+    store = BlobStore(brand.key)
+    # one keyed lookup resolves every post of the page
+    existing = {}
+    for row in (storeData.objects.filter(platform="Instagram", postKey__in=[post.postKey for post, _, _ in posts])
+                .only("postKey", "fingerprint", "instaVideoURL", "instaMediaLinks", "instaMediaVariants")):
+        existing[row.postKey] = row
+    newPosts = []
+    knownPosts = []
+    for post, videoURL, links in posts:
+        instaDataa = existing.get(post.postKey)
+        if instaDataa is None:
+            # queue the files; the row is only written once they are in the store
+            if videoURL:
+                store.add(videoURL, ".mp4", post.instaPostID)
+            for value in links:
+                store.add(value, ".jpg" if is_image(value) else ".mp4", post.instaPostID)
+            newPosts.append((post, videoURL, links))
+        else:
+            # rewritten only if it changed; the stored row lends its media
+            post.instaVideoURL = instaDataa.instaVideoURL
+            post.instaMediaLinks = instaDataa.instaMediaLinks
+            post.instaMediaVariants = instaDataa.instaMediaVariants
+            knownPosts.append(post)
+
+    summary = DownloadPool().run(jobs + store.jobs())
+    store.commit(summary)
+    readyPosts = []
+    for post, videoURL, links in newPosts:
+        localMedLinks = [store.url(link) for link in links]
+        if None in localMedLinks or (videoURL and not store.url(videoURL)):
+            continue
+        post.instaVideoURL = store.url(videoURL) if videoURL else None
+        post.instaMediaLinks = localMedLinks
+        readyPosts.append(post)
+    # responsive images for the new posts, and for stored ones that predate them
+    variants.render(readyPosts + [post for post in knownPosts if post.instaMediaLinks and post.instaMediaVariants is None])
+    stored = {row.postKey: (row.sno, row.fingerprint) for row in existing.values()}
+    with transaction.atomic():
+        created, updated = write(storeData, readyPosts + knownPosts, ["instaIsVideo", "instaDesc", "instaIsSingle", "instaLikes", "instaPostLink", "instaMediaVariants"], stored)
+        # each page commits on its own, a later failing page must not leave it uncached
+        if created or updated:
+            pagecache.changed(brand)
+    return created, updated, summary, len(readyPosts) == len(newPosts)
+
+
+def ingest_instagram(brand, full=False):
+    storeData = brand.model("storeData")
+    cursor = load_cursor(brand, "Instagram")
+    pageSize = settings.INGEST_INSTAGRAM_PAGE_SIZE
+    # gettokenfrom db
+    accessToken = brand.model("instagramAccessToken").objects.all()[0].accessToken
+    instaGraphAPI = GRAPH_URL.format(brand.instagramUsername, PROFILE_FIELDS + "," + media_edge(pageSize), accessToken)
+    response = conditional_get(instaGraphAPI)
+    if response.status_code == 304:
+        advance(cursor)
+        return f'Status code: {response.status_code}'
+    if response.status_code != 200:
+        raise client.UpstreamError(f'Failed to fetch data. Status code: {response.status_code}')
+
+    data = response.json()["business_discovery"]
+    # the profile picture rides along with the first page's downloads. Its
+    # validator is keyed on the URL without the CDN's rotating signature
+    # (oh/oe), or every run would find none and download it again.
+    picture = data["profile_picture_url"]
+    jobs = [MediaJob(picture, brand.instagramPicture, "static", "profile", validator=validator_for(source_key(picture)))]
+
+    media = _unseen(cursor, iter_media(brand.instagramUsername, accessToken, data.pop("media", {}), pageSize), full)
+    summary = DownloadSummary()
+    created = updated = 0
+    newest = None
+    complete = True
+    while True:
+        page = list(islice(media, pageSize))
+        if not page:
+            break
+        if newest is None:
+            newest = (page[0][0]["id"], page[0][1])
+        posts = [_parse(storeData, item, published) for item, published in page if "media_url" in item]
+        metrics.current().items(seen=len(page))
+        pageCreated, pageUpdated, pageSummary, pageComplete = _store_page(brand, storeData, posts, jobs)
+        jobs = []
+        created += pageCreated
+        updated += pageUpdated
+        summary.merge(pageSummary)
+        complete = complete and pageComplete
+    if jobs:
+        summary.merge(DownloadPool().run(jobs))
+
+    with transaction.atomic():
+        profiles.store(brand, "dpInsta",
+                       followerCount=format_count(data["followers_count"]),
+                       dataURL=f"/static/{brand.instagramPicture}",
+                       dpURL=f"/static/{brand.instagramPicture}",
+                       instaHandle=brand.displayName,
+                       instaLink=brand.instagramLink)
+        # a post held back for its media keeps the watermark put so the next run retries it
+        advance(cursor, *(newest if complete and newest else ()))
+    # and so does the ETag, or the next run would get a 304 and never see it
+    if complete:
+        remember(response)
+    metrics.current().items(created=created, updated=updated)
+    return f'Status code: {response.status_code} ({created} new, {updated} updated, {summary})'
@@ -0,0 +1,35 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ingestion import client, engine, ratelimit
+from ingestion.brands import BRANDS
+
+
+class Command(BaseCommand):
+    help = "Runs YouTube, banner, Twitter and Instagram ingestion for every registered brand in this process."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--brand", action="append", choices=list(BRANDS),
+                            help="Only ingest this brand (repeatable). Defaults to all brands.")
+        parser.add_argument("--platform", action="append", choices=list(engine.PLATFORMS),
+                            help="Only run this platform (repeatable). Defaults to all platforms.")
+        parser.add_argument("--full", action="store_true",
+                            help="Ignore the stored watermarks and refresh everything upstream returns.")
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        results = engine.run(options["brand"], options["platform"], options["full"])
+        for result in results:
+            self.stdout.write(f"{result.brand:<12} {result.platform:<10} {result.elapsed:7.2f}s "
+                              f"{result.queries:4d}q {result.seen:4d} seen {result.created:4d} new "
+                              f"{result.updated:4d} updated {result.bytes:10d}B  {result.status}")
+        for host, counts in client.pool_stats().items():
+            self.stdout.write(f"{host}: {counts['requests']} requests over {counts['connections']} connections")
+        for host, state in ratelimit.stats().items():
+            self.stdout.write(f"{host}: {state['requests']} paced at {state['rate']}/s, "
+                              f"{state['throttled']} throttled, {state['waited']}s waited")
+        self.stdout.write(f"total {time.monotonic() - started:.2f}s")
+        failed = [f"{result.brand}/{result.platform}" for result in results if not result.ok]
+        if failed:
+            raise CommandError(f"ingestion failed for {', '.join(failed)}")
@@ -0,0 +1,92 @@
+import threading
+import time
+from contextlib import contextmanager
+
+from django.db import connection
+
+_local = threading.local()
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        started = time.monotonic()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.monotonic() - started
+
+
+@contextmanager
+def count_queries():
+    counter = QueryCounter()
+    with connection.execute_wrapper(counter):
+        yield counter
+
+
+class StageMetrics:
+    """
+    What one fetcher did for one brand, filled in while it runs.
+
+    The HTTP client adds fetch time, DownloadPool adds download time and
+    bytes, ingesters add the items they saw, created and updated.
+    """
+
+    def __init__(self):
+        self.fetches = 0
+        self.fetchSeconds = 0.0
+        self.downloadSeconds = 0.0
+        self.bytes = 0
+        self.seen = 0
+        self.created = 0
+        self.updated = 0
+        self.errors = 0
+
+    def fetched(self, seconds):
+        self.fetches += 1
+        self.fetchSeconds += seconds
+
+    def downloaded(self, summary):
+        self.downloadSeconds += summary.elapsed
+        self.bytes += summary.bytes
+        self.errors += summary.failed
+
+    def items(self, seen=0, created=0, updated=0):
+        self.seen += seen
+        self.created += created
+        self.updated += updated
+
+
+@contextmanager
+def stage_metrics():
+    """Makes a fresh StageMetrics the current one for this thread."""
+    metrics = StageMetrics()
+    _local.stage = metrics
+    try:
+        yield metrics
+    finally:
+        _local.stage = None
+
+
+def current():
+    # outside a stage (or on a download thread) this is a throwaway instance
+    return getattr(_local, "stage", None) or StageMetrics()
+
+
+def exposition(families):
+    """
+    Renders ``[(name, type, help, [(labels, value), ...]), ...]`` in the
+    Prometheus text format.
+    """
+    lines = []
+    for name, kind, help, samples in families:
+        lines.append(f"# HELP {name} {help}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, value in samples:
+            labelText = ",".join(f'{key}="{labelValue}"' for key, labelValue in labels.items())
+            lines.append(f"{name}{{{labelText}}} {value}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,34 @@
+# Generated by Django 5.1.15 on 2026-10-18 12:05
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MediaBlob',
+            fields=[
+                ('sno', models.AutoField(primary_key=True, serialize=False)),
+                ('storeTime', models.DateTimeField(default=django.utils.timezone.now)),
+                ('sha256', models.CharField(max_length=64, unique=True)),
+                ('path', models.CharField(max_length=255)),
+                ('size', models.BigIntegerField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='MediaSource',
+            fields=[
+                ('sno', models.AutoField(primary_key=True, serialize=False)),
+                ('sourceKey', models.CharField(max_length=255, unique=True)),
+                ('blob', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sources', to='ingestion.mediablob')),
+            ],
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.15 on 2026-10-18 12:06
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ingestion', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UpstreamValidator',
+            fields=[
+                ('sno', models.AutoField(primary_key=True, serialize=False)),
+                ('storeTime', models.DateTimeField(default=django.utils.timezone.now)),
+                ('urlHash', models.CharField(max_length=64, unique=True)),
+                ('url', models.TextField()),
+                ('etag', models.CharField(blank=True, max_length=255)),
+                ('lastModified', models.CharField(blank=True, max_length=255)),
+            ],
+        ),
+    ]
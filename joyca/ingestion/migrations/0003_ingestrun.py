@@ -0,0 +1,40 @@
+# Generated by Django 5.1.15 on 2026-10-18 12:18
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ingestion', '0002_upstreamvalidator'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IngestRun',
+            fields=[
+                ('sno', models.AutoField(primary_key=True, serialize=False)),
+                ('storeTime', models.DateTimeField(default=django.utils.timezone.now)),
+                ('brand', models.CharField(max_length=32)),
+                ('platform', models.CharField(max_length=32)),
+                ('ok', models.BooleanField(default=True)),
+                ('status', models.CharField(max_length=255)),
+                ('elapsed', models.FloatField(default=0)),
+                ('fetches', models.PositiveIntegerField(default=0)),
+                ('fetchSeconds', models.FloatField(default=0)),
+                ('downloadSeconds', models.FloatField(default=0)),
+                ('dbSeconds', models.FloatField(default=0)),
+                ('parseSeconds', models.FloatField(default=0)),
+                ('queries', models.PositiveIntegerField(default=0)),
+                ('bytes', models.BigIntegerField(default=0)),
+                ('seen', models.PositiveIntegerField(default=0)),
+                ('created', models.PositiveIntegerField(default=0)),
+                ('updated', models.PositiveIntegerField(default=0)),
+                ('errors', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['brand', 'platform', 'storeTime'], name='ingestion_i_brand_32ceab_idx')],
+            },
+        ),
+    ]
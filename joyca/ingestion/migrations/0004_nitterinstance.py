@@ -0,0 +1,25 @@
+# Generated by Django 5.1.15 on 2026-10-18 12:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ingestion', '0003_ingestrun'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NitterInstance',
+            fields=[
+                ('sno', models.AutoField(primary_key=True, serialize=False)),
+                ('url', models.CharField(max_length=255, unique=True)),
+                ('latency', models.FloatField(blank=True, null=True)),
+                ('successes', models.PositiveIntegerField(default=0)),
+                ('failures', models.PositiveIntegerField(default=0)),
+                ('lastChecked', models.DateTimeField(blank=True, null=True)),
+                ('lastOk', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+    ]
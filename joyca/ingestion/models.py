@@ -0,0 +1,94 @@
+from django.db import models
+from django.utils.timezone import now
+
+
+class MediaBlob(models.Model):
+    sno = models.AutoField(primary_key=True)
+    storeTime = models.DateTimeField(default=now)
+    sha256 = models.CharField(max_length=64, unique=True)
+    path = models.CharField(max_length=255)
+    size = models.BigIntegerField()
+
+    def __str__(self):
+        return f"{self.sha256[:12]} - {self.path}"
+
+
+class MediaSource(models.Model):
+    sno = models.AutoField(primary_key=True)
+    # upstream URL path without the signed query string, stable across fetches
+    sourceKey = models.CharField(max_length=255, unique=True)
+    blob = models.ForeignKey(MediaBlob, on_delete=models.CASCADE, related_name="sources")
+
+
+class UpstreamValidator(models.Model):
+    sno = models.AutoField(primary_key=True)
+    storeTime = models.DateTimeField(default=now)
+    # sha256 of the URL, the URL itself can be longer than an index allows
+    urlHash = models.CharField(max_length=64, unique=True)
+    url = models.TextField()
+    etag = models.CharField(max_length=255, blank=True)
+    lastModified = models.CharField(max_length=255, blank=True)
+
+    def headers(self):
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.lastModified:
+            headers["If-Modified-Since"] = self.lastModified
+        return headers
+
+    def update(self, response):
+        """Copies the validators off a 200 response; returns True if they changed."""
+        etag = response.headers.get("ETag", "")[:255]
+        lastModified = response.headers.get("Last-Modified", "")[:255]
+        if (etag, lastModified) == (self.etag, self.lastModified):
+            return False
+        self.etag = etag
+        self.lastModified = lastModified
+        self.storeTime = now()
+        return True
+
+
+class IngestRun(models.Model):
+    """One fetcher run for one brand, as reported by ``manage.py ingest``."""
+    sno = models.AutoField(primary_key=True)
+    storeTime = models.DateTimeField(default=now)
+    brand = models.CharField(max_length=32)
+    platform = models.CharField(max_length=32)
+    ok = models.BooleanField(default=True)
+    status = models.CharField(max_length=255)
+    elapsed = models.FloatField(default=0)
+    fetches = models.PositiveIntegerField(default=0)
+    fetchSeconds = models.FloatField(default=0)
+    downloadSeconds = models.FloatField(default=0)
+    dbSeconds = models.FloatField(default=0)
+    # whatever is left: parsing feeds and mapping them onto rows
+    parseSeconds = models.FloatField(default=0)
+    queries = models.PositiveIntegerField(default=0)
+    bytes = models.BigIntegerField(default=0)
+    seen = models.PositiveIntegerField(default=0)
+    created = models.PositiveIntegerField(default=0)
+    updated = models.PositiveIntegerField(default=0)
+    errors = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        indexes = [models.Index(fields=["brand", "platform", "storeTime"])]
+
+    def __str__(self):
+        return f"{self.storeTime:%Y-%m-%d %H:%M} - {self.brand}/{self.platform} - {self.status}"
+
+
+class NitterInstance(models.Model):
+    """Health of one public Nitter instance, ranked by ``ingestion.nitterpool``."""
+    sno = models.AutoField(primary_key=True)
+    url = models.CharField(max_length=255, unique=True)
+    # moving average of the profile page fetch, seconds
+    latency = models.FloatField(blank=True, null=True)
+    successes = models.PositiveIntegerField(default=0)
+    # consecutive failures, reset by the next success
+    failures = models.PositiveIntegerField(default=0)
+    lastChecked = models.DateTimeField(blank=True, null=True)
+    lastOk = models.DateTimeField(blank=True, null=True)
+
+    def __str__(self):
+        return f"{self.url} - {self.latency or 0:.2f}s - {self.failures} failures"
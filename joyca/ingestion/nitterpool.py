@@ -0,0 +1,81 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from django.conf import settings
+from django.utils.timezone import now
+
+from . import client
+from .models import NitterInstance
+
+logger = logging.getLogger(__name__)
+
+# the list ntscraper itself probes when skip_instance_check is off
+INSTANCES_URL = "https://raw.githubusercontent.com/libredirect/instances/main/data.json"
+PROBE_PATH = "/x"
+HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0"}
+
+# weight of the newest sample in the latency moving average
+LATENCY_WEIGHT = 0.3
+
+_refreshLock = threading.Lock()
+
+
+def ranked():
+    """
+    URLs of the instances that have answered before and have not failed
+    INGEST_NITTER_MAX_FAILURES times in a row since, fewest recent failures
+    first, then fastest. However old the last success, a stored instance is
+    tried before anything gets probed; its failures are what retire it.
+    """
+    return list(NitterInstance.objects.filter(lastOk__isnull=False, failures__lt=settings.INGEST_NITTER_MAX_FAILURES)
+                .order_by("failures", "latency").values_list("url", flat=True))
+
+
+def record(url, ok, latency=None):
+    instance = NitterInstance.objects.get_or_create(url=url)[0]
+    instance.lastChecked = now()
+    if ok:
+        instance.successes += 1
+        instance.failures = 0
+        instance.lastOk = instance.lastChecked
+        if latency is not None:
+            instance.latency = latency if instance.latency is None else (
+                LATENCY_WEIGHT * latency + (1 - LATENCY_WEIGHT) * instance.latency)
+    else:
+        instance.failures += 1
+    instance.save()
+
+
+def _probe(url):
+    started = time.monotonic()
+    try:
+        response = client.get(url + PROBE_PATH, headers=HEADERS, cookies={"hlsPlayback": "on"},
+                              timeout=settings.INGEST_NITTER_PROBE_TIMEOUT)
+    except requests.RequestException:
+        return url, False, None
+    # same test as ntscraper: a working instance renders a timeline
+    return url, response.ok and "timeline-item" in response.text, time.monotonic() - started
+
+
+def refresh(exclude=()):
+    """
+    Returns the ranking without the ``exclude`` URLs, probing every listed
+    public instance in parallel first when that leaves nothing. Only one
+    thread probes at a time, the others wait and reuse its results.
+    """
+    with _refreshLock:
+        current = [url for url in ranked() if url not in exclude]
+        if current:
+            return current
+        response = client.get(INSTANCES_URL)
+        response.raise_for_status()
+        urls = response.json()["nitter"]["clearnet"]
+        with ThreadPoolExecutor(max_workers=settings.INGEST_DOWNLOAD_WORKERS) as executor:
+            results = list(executor.map(_probe, urls))
+        for url, ok, latency in results:
+            record(url, ok, latency)
+        logger.info("nitter probe: %s of %s instances working", sum(ok for _, ok, _ in results), len(urls))
+        return [url for url in ranked() if url not in exclude]
@@ -0,0 +1,97 @@
+import re
+import time
+from datetime import datetime, timezone
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+
+VERSION_KEY = "feed:version:{}"
+COUNTER_KEY = "feed:{}:{}"
+RESULTS = ("hit", "miss")
+# shape of the feed page cursors, anything else is rendered uncached
+CURSOR = re.compile(r"[A-Za-z0-9_-]{0,64}")
+
+
+def stamp(key):
+    """
+    A shared version stamp. A time stamp rather than a counter: if the
+    cache ever drops it, the fresh value still differs from every value
+    handed out before.
+    """
+    current = cache.get(key)
+    if current is None:
+        cache.add(key, time.time_ns(), None)
+        current = cache.get(key)
+    return current
+
+
+def restamp(key):
+    cache.set(key, time.time_ns(), None)
+
+
+def version(brand):
+    """The brand's content version, part of every cached page key."""
+    return stamp(VERSION_KEY.format(brand))
+
+
+def bump(brand):
+    restamp(VERSION_KEY.format(brand))
+
+
+def etag(request, brand, platform=None, **options):
+    # per URL validators, so the brand's version is enough; no rendering needed
+    return str(version(brand))
+
+
+def last_modified(request, brand, platform=None, **options):
+    return datetime.fromtimestamp(version(brand) / 1e9, tz=timezone.utc)
+
+
+def changed(brand):
+    """Bumps the brand's version once the current transaction commits."""
+    transaction.on_commit(lambda: bump(brand.key))
+
+
+def _count(brand, result):
+    key = COUNTER_KEY.format(result, brand)
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # evicted between add and incr
+        cache.set(key, 1, None)
+
+
+def counters(brands):
+    """``[(brand, result, count), ...]`` for the page cache hits and misses."""
+    keys = {COUNTER_KEY.format(result, brand): (brand, result) for brand in brands for result in RESULTS}
+    found = cache.get_many(list(keys))
+    return [(brand, result, found.get(key, 0)) for key, (brand, result) in keys.items()]
+
+
+def cached_page(view):
+    """
+    Serves a feed view from the cache: one entry per brand (so per domain),
+    platform, page cursor and content version. Ingests bump the version, so
+    a hit never needs the database.
+    """
+    @wraps(view)
+    def wrapper(request, brand, platform=None, **options):
+        cursor = request.GET.get("cursor", "")
+        if request.method != "GET" or not CURSOR.fullmatch(cursor):
+            return view(request, brand, platform, **options)
+        variant = ",".join(f"{name}={value}" for name, value in sorted(options.items()))
+        key = f"feed:page:{brand}:{version(brand)}:{platform or 'all'}:{variant}:{cursor}"
+        content = cache.get(key)
+        if content is not None:
+            _count(brand, "hit")
+            return HttpResponse(content)
+        _count(brand, "miss")
+        response = view(request, brand, platform, **options)
+        if response.status_code == 200:
+            cache.set(key, response.content, settings.INGEST_PAGE_CACHE_TTL)
+        return response
+    return wrapper
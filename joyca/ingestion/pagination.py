@@ -0,0 +1,48 @@
+import base64
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+
+from django.db.models import DateTimeField, Q
+from django.http import Http404
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+
+KeysetPage = namedtuple("KeysetPage", ["items", "nextCursor"])
+
+
+def encode_cursor(row, key="publishDateYT"):
+    value = getattr(row, key)
+    if isinstance(value, datetime):
+        value = (value - EPOCH) // MICROSECOND
+    position = f"{value}.{row.sno}"
+    return base64.urlsafe_b64encode(position.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token, isTime=True):
+    """``(key value, sno)``; raises ValueError for anything not made by encode_cursor."""
+    position = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+    value, sno = position.split(".")
+    value = int(value)
+    return EPOCH + value * MICROSECOND if isTime else value, int(sno)
+
+
+def keyset_page(queryset, token, size, key="publishDateYT"):
+    """
+    One page of ``queryset`` ordered on (``key``, sno) descending, newest
+    (or highest) first, and positioned by an opaque cursor rather than an
+    offset, so every page is one range read on an index over ``key``. An
+    empty token is the first page, the page's ``nextCursor`` the one after it.
+    """
+    newestFirst = ("-" + key, "-sno")
+    if token:
+        try:
+            value, sno = decode_cursor(token, isinstance(queryset.model._meta.get_field(key), DateTimeField))
+        except (ValueError, OverflowError):
+            raise Http404("Invalid page cursor")
+        queryset = queryset.filter(Q(**{key + "__lt": value}) | Q(**{key: value, "sno__lt": sno}))
+    rows = list(queryset.order_by(*newestFirst)[:size + 1])
+    return KeysetPage(
+        items=rows[:size],
+        nextCursor=encode_cursor(rows[size - 1], key) if len(rows) > size else None,
+    )
@@ -0,0 +1,68 @@
+import threading
+
+from django.db import transaction
+from django.utils.timezone import now
+
+from . import pagecache
+from .brands import BRANDS
+
+# feed template context name -> singleton model of the brand's app
+PROFILES = {
+    "YTBanner": "bannerYT",
+    "instaData": "dpInsta",
+    "twitterData": "twitterDP",
+    "domain": "domain",
+}
+VERSION_KEY = "profiles:version:{}"
+
+_local = {}
+_lock = threading.Lock()
+
+
+def profiles(brand):
+    """
+    The header singletons of ``brand`` as feed context, from this process'
+    copy while the shared version stamp is unchanged.
+    """
+    version = pagecache.stamp(VERSION_KEY.format(brand.key))
+    cached = _local.get(brand.key)
+    if cached and cached[0] == version:
+        return cached[1]
+    loaded = {name: brand.model(model).objects.first() for name, model in PROFILES.items()}
+    with _lock:
+        _local[brand.key] = (version, loaded)
+    return loaded
+
+
+def store(brand, model, **values):
+    """
+    Writes ``values`` onto the brand's ``model`` singleton. The row is only
+    saved (and storeTime stamped) when one of them changed, since every save
+    invalidates the header and the brand's cached pages.
+    """
+    profile = brand.model(model).objects.get_or_create()[0]
+    changed = {name: value for name, value in values.items() if getattr(profile, name) != value}
+    if changed:
+        for name, value in changed.items():
+            setattr(profile, name, value)
+        profile.storeTime = now()
+        profile.save()
+    return profile
+
+
+def _restamp(brand):
+    with _lock:
+        _local.pop(brand, None)
+    pagecache.restamp(VERSION_KEY.format(brand))
+    # cached pages embed the header too
+    pagecache.bump(brand)
+
+
+def invalidate(sender, using=None, **kwargs):
+    """
+    post_save/post_delete receiver: once the write commits, every worker
+    reloads the brand's singletons on its next request.
+    """
+    for brand in BRANDS.values():
+        if brand.app == sender._meta.app_label:
+            transaction.on_commit(lambda key=brand.key: _restamp(key), using=using)
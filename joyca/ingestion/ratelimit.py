@@ -0,0 +1,129 @@
+import logging
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+from django.conf import settings
+from django.utils.timezone import now
+
+logger = logging.getLogger(__name__)
+
+# statuses that mean "slow down" rather than "this request is wrong"
+THROTTLE_STATUSES = (429, 500, 502, 503, 504)
+
+_buckets = {}
+_lock = threading.Lock()
+
+
+def retry_after(headers):
+    """Seconds asked for by a ``Retry-After`` header (delta or HTTP date), or None."""
+    value = headers.get("Retry-After") if headers is not None else None
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max((parsedate_to_datetime(value) - now()).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Paces requests to one upstream host.
+
+    Tokens refill at ``rate`` per second up to ``burst``; every request takes
+    one. A throttling answer (429/5xx) halves the rate and blocks the host
+    for its ``Retry-After`` or an exponential backoff; each success then adds
+    a tenth of the configured rate back until it is reached again.
+    """
+
+    def __init__(self, rate, burst):
+        self.baseRate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blockedUntil = 0.0
+        self.backoff = 0.0
+        self.requests = 0
+        self.throttled = 0
+        self.waited = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, at):
+        self.tokens = min(self.burst, self.tokens + (at - self.updated) * self.rate)
+        self.updated = at
+
+    def acquire(self):
+        """Blocks until the host may be called; returns the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                at = time.monotonic()
+                self._refill(at)
+                if at >= self.blockedUntil and self.tokens >= 1:
+                    self.tokens -= 1
+                    self.requests += 1
+                    self.waited += waited
+                    return waited
+                delay = max(self.blockedUntil - at, (1 - self.tokens) / self.rate)
+            time.sleep(delay)
+            waited += delay
+
+    def penalise(self, delay=None):
+        with self._lock:
+            self.throttled += 1
+            self.rate = max(self.baseRate / 16, self.rate / 2)
+            self.backoff = min(settings.INGEST_RATE_MAX_BACKOFF,
+                               self.backoff * 2 if self.backoff else settings.INGEST_HTTP_BACKOFF)
+            if delay is None:
+                delay = self.backoff
+            self.blockedUntil = max(self.blockedUntil, time.monotonic() + min(delay, settings.INGEST_RATE_MAX_BACKOFF))
+
+    def succeeded(self):
+        with self._lock:
+            self.backoff = 0.0
+            self.rate = min(self.baseRate, self.rate + self.baseRate / 10)
+
+    def state(self):
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                "rate": round(self.rate, 3),
+                "tokens": round(self.tokens, 2),
+                "blockedFor": round(max(self.blockedUntil - time.monotonic(), 0.0), 2),
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "waited": round(self.waited, 2),
+            }
+
+
+def configured_rate(host):
+    # longest matching suffix wins, so "cdninstagram.com" covers every CDN edge
+    matches = [suffix for suffix in settings.INGEST_RATE_LIMITS if host == suffix or host.endswith("." + suffix)]
+    if matches:
+        return settings.INGEST_RATE_LIMITS[max(matches, key=len)]
+    return settings.INGEST_RATE_DEFAULT
+
+
+def bucket_for(host):
+    with _lock:
+        if host not in _buckets:
+            _buckets[host] = TokenBucket(configured_rate(host), settings.INGEST_RATE_BURST)
+        return _buckets[host]
+
+
+def stats():
+    """Current pacing state per host: ``{host: {"rate", "tokens", "blockedFor", ...}}``."""
+    with _lock:
+        buckets = dict(_buckets)
+    return {host: bucket.state() for host, bucket in buckets.items()}
+
+
+def log_stats():
+    for host, state in stats().items():
+        if state["throttled"] or state["waited"]:
+            logger.info("%s: %s", host, state)
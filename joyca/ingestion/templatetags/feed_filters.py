@@ -0,0 +1,26 @@
+from django import template
+from django.conf import settings
+
+from ingestion.utils import format_count
+
+register = template.Library()
+
+@register.filter
+def instaMedia(link, postID):
+    # rows ingested before the blob store hold a bare filename under media/<postID>/
+    if link.startswith("/"):
+        return link
+    return f"{settings.STATIC_URL}instagram/media/{postID}/{link}"
+
+
+@register.filter
+def instaSources(variants, link):
+    # <source> entries for one stored image, AVIF before WebP
+    sources = [{"type": mime, "srcset": srcset} for mime, srcset in ((variants or {}).get(link) or {}).items()]
+    return sorted(sources, key=lambda source: source["type"] != "image/avif")
+
+
+@register.filter
+def formatCount(count):
+    # counters are stored raw, "12.5K" is display only
+    return format_count(count)
@@ -0,0 +1,129 @@
+import logging
+import time
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.db import transaction
+from ntscraper import Nitter
+
+from . import metrics, nitterpool, pagecache, profiles, ratelimit
+from .cursors import advance, is_known, load_cursor
+from .upsert import stored_fingerprints, write
+from .utils import extract_twitter_id, format_count
+
+logger = logging.getLogger(__name__)
+
+# ntscraper talks to whichever public instance it picked through its own
+# session, so every instance shares one bucket
+NITTER = "nitter"
+
+
+def _paced(call, *args, **kwargs):
+    bucket = ratelimit.bucket_for(NITTER)
+    bucket.acquire()
+    started = time.monotonic()
+    try:
+        result = call(*args, **kwargs)
+    except Exception:
+        bucket.penalise()
+        raise
+    finally:
+        metrics.current().fetched(time.monotonic() - started)
+    # ntscraper answers None once every instance it tried failed
+    if result is None:
+        bucket.penalise()
+    else:
+        bucket.succeeded()
+    return result
+
+
+def _open(username):
+    """
+    Returns ``(scraper, instance, profile, fallbacks)`` for the best ranked
+    Nitter instance that serves ``username``'s profile. Falls back down the
+    cached ranking, and to a fresh probe of every public instance only once
+    the cached ones are exhausted.
+    """
+    started = time.monotonic()
+    tried = []
+    candidates = nitterpool.ranked()
+    for attempt in range(2):
+        if attempt or not candidates:
+            candidates = nitterpool.refresh(exclude=tried)
+        for instance in candidates[:settings.INGEST_NITTER_ATTEMPTS]:
+            tried.append(instance)
+            scraper = Nitter(instances=instance, log_level=1, skip_instance_check=True)
+            attemptStarted = time.monotonic()
+            profile = _paced(scraper.get_profile_info, username, max_retries=settings.INGEST_NITTER_RETRIES, instance=instance)
+            nitterpool.record(instance, profile is not None, time.monotonic() - attemptStarted)
+            if profile is not None:
+                logger.info("nitter: using %s after %s fallbacks, %.2fs", instance, len(tried) - 1, time.monotonic() - started)
+                return scraper, instance, profile, len(tried) - 1
+    raise RuntimeError(f"no working Nitter instance among {len(tried)} tried")
+
+
+def ingest_twitter(brand, full=False):
+    storeData = brand.model("storeData")
+    cursor = load_cursor(brand, "Twitter")
+    selectStarted = time.monotonic()
+    scraper, instance, profile, fallbacks = _open(brand.twitterUsername)
+    selectSeconds = time.monotonic() - selectStarted
+    # past the first run only ask Nitter for the days since the watermark
+    since = None
+    if cursor.lastPublished and not full:
+        since = cursor.lastPublished.astimezone(timezone.utc).strftime("%Y-%m-%d")
+    tweets = {}
+    newest = None
+    for tweet in _paced(scraper.get_tweets, brand.twitterUsername, mode='user', number=30, since=since,
+                          max_retries=settings.INGEST_NITTER_RETRIES, instance=instance)['tweets']:
+        twitterPostID = extract_twitter_id(tweet["link"])
+        published = datetime.strptime(tweet["date"], "%b %d, %Y · %I:%M %p %Z").replace(tzinfo=timezone.utc)
+        if is_known(cursor, twitterPostID, published, full):
+            break
+        if newest is None or published > newest[1]:
+            newest = (twitterPostID, published)
+        tweets[twitterPostID] = tweet
+    # one keyed lookup for every tweet returned, then writes for the new and changed ones
+    stored = stored_fingerprints(storeData, "Twitter", tweets)
+    rows = []
+    for twitterPostID, tweet in tweets.items():
+        # retweets and quotes are never stored, but stored posts keep being refreshed
+        if twitterPostID not in stored and (tweet["is-retweet"] or tweet["quoted-post"]):
+            continue
+        isVid = False
+        mediaURL = ""
+        if tweet["videos"]:
+            isVid = True
+            mediaURL = tweet["videos"][0]
+        elif tweet["pictures"]:
+            isVid = False
+            mediaURL = tweet["pictures"][0]
+
+        input_datetime = datetime.strptime(tweet["date"], "%b %d, %Y · %I:%M %p %Z")
+        formatted_datetime = input_datetime.strftime("%Y-%m-%d %H:%M:%S.%U")
+        rows.append(storeData(
+            tweetText = tweet["text"],
+            twitterLikes = int(tweet["stats"]["likes"]),
+            tweetLink = tweet["link"],
+            twitterIsVideo = isVid,
+            twitterMediaURL= mediaURL,
+            platform = "Twitter",
+            publishDateYT = formatted_datetime,
+            twitterPostID = twitterPostID,
+            postKey = twitterPostID
+        ))
+
+    with transaction.atomic():
+        created, updated = write(storeData, rows, ["tweetText", "twitterLikes", "tweetLink"], stored)
+        if created or updated:
+            pagecache.changed(brand)
+        advance(cursor, *(newest or ()))
+    metrics.current().items(len(tweets), created, updated)
+
+    profiles.store(brand, "twitterDP",
+                   dpURL=profile["image"],
+                   twitterHandle=brand.twitterHandle,
+                   twitterLink=brand.twitterLink,
+                   followerCount=format_count(profile["stats"]["followers"]))
+    return (f"Status: OK ({created} new, {updated} updated, via {instance} "
+            f"after {fallbacks} fallbacks in {selectSeconds:.2f}s)")
@@ -0,0 +1,68 @@
+import json
+from collections import defaultdict
+from hashlib import blake2b
+
+from django.db import connections
+
+UNIQUE_FIELDS = ["platform", "postKey"]
+# hex digits of fingerprint per field
+SEGMENT = 8
+
+
+def fingerprint(row, fields):
+    """
+    One short hash per field of ``fields``, concatenated: comparing two
+    fingerprints segment by segment tells which of the fields changed.
+    """
+    return "".join(
+        blake2b(json.dumps(getattr(row, field), sort_keys=True, default=str).encode(), digest_size=SEGMENT // 2).hexdigest()
+        for field in fields
+    )
+
+
+def changed_fields(old, new, fields):
+    return [field for index, field in enumerate(fields)
+            if old[index * SEGMENT:(index + 1) * SEGMENT] != new[index * SEGMENT:(index + 1) * SEGMENT]]
+
+
+def stored_fingerprints(storeData, platform, keys):
+    """``{postKey: (sno, fingerprint)}`` for the ``keys`` already stored for ``platform``."""
+    return {key: (sno, hashed) for key, sno, hashed in
+            storeData.objects.filter(platform=platform, postKey__in=list(keys)).values_list("postKey", "sno", "fingerprint")}
+
+
+def upsert(storeData, rows, fields):
+    """
+    Writes ``rows`` in one statement: new posts are inserted, posts already
+    stored under the same (platform, postKey) get ``fields`` overwritten
+    (INSERT ... ON DUPLICATE KEY UPDATE on MySQL).
+    """
+    if not rows:
+        return
+    # MySQL takes no conflict target, ON DUPLICATE KEY finds the unique index itself
+    target = UNIQUE_FIELDS if connections[storeData.objects.db].features.supports_update_conflicts_with_target else None
+    storeData.objects.bulk_create(rows, update_conflicts=True, unique_fields=target, update_fields=fields)
+
+
+def write(storeData, rows, fields, stored, extra=()):
+    """
+    Stores ``rows`` given what ``stored_fingerprints`` found for them: new
+    posts are upserted, known ones are written only when their ``fields``
+    changed, and then only the changed columns (plus ``extra``), one UPDATE
+    per set of changed columns. Returns ``(created, updated)``.
+    """
+    newRows = []
+    groups = defaultdict(list)
+    for row in rows:
+        row.fingerprint = fingerprint(row, fields)
+        if row.postKey not in stored:
+            newRows.append(row)
+            continue
+        row.sno, old = stored[row.postKey]
+        changed = changed_fields(old, row.fingerprint, fields)
+        if changed:
+            groups[tuple(changed)].append(row)
+    upsert(storeData, newRows, [*fields, *extra, "fingerprint"])
+    for changed, group in groups.items():
+        storeData.objects.bulk_update(group, [*changed, *extra, "fingerprint"])
+    return len(newRows), sum(len(group) for group in groups.values())
@@ -0,0 +1,37 @@
+from django.urls import path
+
+from . import views
+from .brands import BRANDS
+
+# route -> (platform, url name) of every feed a brand site serves
+FEEDS = {
+    "": (None, "home"),
+    "youtube": ("YouTube", "youtube"),
+    "twitter": ("Twitter", "twitter"),
+    "instagram": ("Instagram", "instagram"),
+}
+
+
+def _join(*parts):
+    return "/".join(part for part in parts if part)
+
+
+def brand_urlpatterns(key):
+    """
+    Every route of the brand ``key``'s site: the feeds, their top posts
+    variants and the card fragments the infinite scroll loads for each.
+    Ingestion has no route, it runs from ``manage.py ingest``.
+    """
+    # an unknown key fails when the URLconf loads, not per request
+    brand = BRANDS[key].key
+    patterns = []
+    for route, (platform, name) in FEEDS.items():
+        options = {"brand": brand, "platform": platform} if platform else {"brand": brand}
+        variants = [(route, name, {})]
+        if platform:
+            variants.append((_join(route, "top"), name + "Top", {"top": True}))
+        for variantRoute, variantName, extra in variants:
+            patterns.append(path(variantRoute, views.feed, {**options, **extra}, name=variantName))
+            patterns.append(path(_join(variantRoute, "cards"), views.feed, {**options, **extra, "fragment": True},
+                                 name=variantName + "Cards"))
+    return patterns
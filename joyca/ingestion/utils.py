@@ -0,0 +1,33 @@
+def is_image(url):
+  """
+  Checks if the given URL points to an image.
+
+  Args:
+      url: The URL to check.
+
+  Returns:
+      True if the URL is an image, False otherwise.
+  """
+  return bool('.jpg' in url)
+
+
+def format_count(count):
+    if int(count) >= 1000 and int(count)<1000000:
+        subsFormat = str(round(int(count)/1000,2))+"K"
+    elif int(count) >= 1000000:
+        subsFormat = str(round(int(count)/1000000,2))+"M"
+    else:
+        subsFormat = str(count)
+    return subsFormat
+
+def extract_twitter_id(url):
+    # Split the URL by "/"
+    parts = url.split("/")
+    
+    # Get the last part of the URL
+    last_part = parts[-1]
+    
+    # Remove any anchor or query string if present
+    twitter_id = last_part.split("#")[0].split("?")[0]
+    
+    return twitter_id
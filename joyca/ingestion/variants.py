@@ -0,0 +1,115 @@
+import atexit
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+
+from .utils import is_image
+
+logger = logging.getLogger(__name__)
+
+# Pillow format name -> (mime type, extension, quality)
+FORMATS = {
+    "AVIF": ("image/avif", "avif", 55),
+    "WEBP": ("image/webp", "webp", 80),
+}
+
+_pool = None
+_poolLock = threading.Lock()
+
+
+def make_variants(source, widths, formats):
+    """
+    Writes resized, re-encoded copies of the image at ``source`` next to it as
+    ``<name>.w<width>.<ext>`` and returns ``{format: [(width, filename), ...]}``.
+
+    Runs in a worker process: plain filesystem work, no Django. Existing
+    variants are kept, so a blob shared by several posts is encoded once.
+    """
+    from PIL import Image, features
+
+    base = os.path.splitext(source)[0]
+    made = {}
+    with Image.open(source) as image:
+        image = image.convert("RGB")
+        # never upscale; an image narrower than every width gets one variant at its own size
+        targets = sorted({min(width, image.width) for width in widths})
+        for name in formats:
+            _, ext, quality = FORMATS[name]
+            if not features.check(name.lower()):
+                continue
+            for width in targets:
+                filename = f"{base}.w{width}.{ext}"
+                if not os.path.exists(filename):
+                    height = round(image.height * width / image.width)
+                    resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+                    # per process part file: two brands may share a blob
+                    partial = f"{filename}.{os.getpid()}.part"
+                    resized.save(partial, name, quality=quality)
+                    os.replace(partial, filename)
+                made.setdefault(name, []).append((width, os.path.basename(filename)))
+    return made
+
+
+def _executor():
+    global _pool
+    with _poolLock:
+        if _pool is None:
+            # spawn: forking a process that runs brand threads can copy held locks
+            _pool = ProcessPoolExecutor(max_workers=settings.INGEST_IMAGE_WORKERS,
+                                        mp_context=multiprocessing.get_context("spawn"))
+            atexit.register(_pool.shutdown)
+        return _pool
+
+
+def local_path(link, postID):
+    """Filesystem path of a stored media link (blob URL or legacy per-post filename)."""
+    if link.startswith(settings.STATIC_URL):
+        return os.path.join(settings.BASE_DIR, "static", link[len(settings.STATIC_URL):])
+    return os.path.join(settings.BASE_DIR, "static", "instagram", "media", postID, link)
+
+
+def _link_url(link, postID):
+    if link.startswith(settings.STATIC_URL):
+        return link
+    return f"{settings.STATIC_URL}instagram/media/{postID}/{link}"
+
+
+def render(rows):
+    """
+    Builds responsive variants for the carousel images of ``rows`` on the
+    process pool and sets ``instaMediaVariants`` on each row to
+    ``{link: {mime type: srcset}}``. Rows are not saved.
+    """
+    wanted = {}
+    for row in rows:
+        for link in row.instaMediaLinks or []:
+            if is_image(link):
+                wanted[(row.instaPostID, link)] = local_path(link, row.instaPostID)
+    # one job per file: deduplicated blobs are shared between posts
+    futures = {}
+    for source in set(wanted.values()):
+        if os.path.exists(source):
+            futures[source] = _executor().submit(make_variants, source, settings.INGEST_IMAGE_WIDTHS, list(FORMATS))
+    srcsets = {}
+    for (postID, link), source in wanted.items():
+        if source not in futures:
+            continue
+        try:
+            made = futures[source].result()
+        except Exception:
+            logger.exception("image variants for %s failed", link)
+            continue
+        folder = _link_url(link, postID).rsplit("/", 1)[0]
+        srcsets[(postID, link)] = {
+            FORMATS[name][0]: ", ".join(f"{folder}/{filename} {width}w" for width, filename in sizes)
+            for name, sizes in made.items()
+        }
+    for row in rows:
+        variants = {link: srcsets[(row.instaPostID, link)] for link in row.instaMediaLinks or []
+                    if (row.instaPostID, link) in srcsets}
+        row.instaMediaVariants = variants or None
+    return len(futures)
@@ -0,0 +1,103 @@
+from django.conf import settings
+from django.db.models import Count, Max
+from django.http import HttpResponse
+from django.shortcuts import render
+from django.urls import reverse
+from django.utils.timezone import now
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+
+from . import pagecache
+from .brands import BRANDS
+from .metrics import exposition
+from .models import IngestRun
+from .pagination import keyset_page
+from .profiles import profiles
+
+PAGE_SIZE = 6
+# storeData columns a feed card renders, by platform; pages load nothing else
+FEED_FIELDS = {
+    "YouTube": ["channelNameYT", "viewsYT", "videoTitleYT", "videoIdYT"],
+    "Twitter": ["twitterLikes", "tweetLink", "tweetText", "twitterIsVideo", "twitterMediaURL"],
+    "Instagram": ["instaLikes", "instaPostLink", "instaDesc", "instaIsVideo", "instaVideoURL", "instaMediaLinks",
+                  "instaMediaVariants", "instaPostID"],
+}
+# the counter a platform's top posts feed is ranked by
+TOP_BY = {"YouTube": "viewsYT", "Instagram": "instaLikes", "Twitter": "twitterLikes"}
+
+
+# browsers revalidate every time, shared caches may keep a page briefly
+@cache_control(public=True, max_age=settings.INGEST_FEED_MAX_AGE, s_maxage=settings.INGEST_FEED_SHARED_MAX_AGE)
+@condition(etag_func=pagecache.etag, last_modified_func=pagecache.last_modified)
+@pagecache.cached_page
+def feed(request, brand, platform=None, top=False, fragment=False):
+    """
+    A page of the brand's feed, or with ``fragment`` only the cards of the
+    page (for the infinite scroll, see static/feed-scroll.js).
+    """
+    brand = BRANDS[brand]
+    storeData = brand.model("storeData")
+    everyData = storeData.objects.all()
+    if platform:
+        everyData = everyData.filter(platform=platform)
+    fields = [field for name in ([platform] if platform else FEED_FIELDS) for field in FEED_FIELDS[name]]
+    everyData = everyData.only("sno", "platform", "publishDateYT", *fields)
+    # top: most viewed/liked first, off the (platform, counter) index
+    page = keyset_page(everyData, request.GET.get("cursor", ""), PAGE_SIZE, TOP_BY[platform] if top else "publishDateYT")
+    context = {"allData":page.items, "nextCursor":page.nextCursor, **profiles(brand)}
+    if fragment:
+        return render(request, "feed_batch.html", context=context)
+    context["cardsURL"] = reverse(request.resolver_match.url_name + "Cards")
+    return render(request,"index.html", context=context)
+
+
+def metrics(request):
+    """Prometheus scrape endpoint for the ingestion run log, all brands."""
+    latest = IngestRun.objects.values("brand", "platform").annotate(last=Max("sno"))
+    runs = IngestRun.objects.filter(sno__in=[row["last"] for row in latest]).order_by("brand", "platform")
+    failures = IngestRun.objects.filter(ok=False).values("brand", "platform").annotate(count=Count("sno"))
+    current = now()
+
+    def labels(brand, platform, **extra):
+        return {"brand": brand, "platform": platform, **extra}
+
+    newest = []
+    freshness = []
+    # off the watermarks rather than the run log, which is pruned
+    for brand in BRANDS.values():
+        for cursor in brand.model("StoreLastIDs").objects.all():
+            if cursor.lastPublished:
+                newest.append((labels(brand.key, cursor.platform.lower()), cursor.lastPublished.timestamp()))
+            if cursor.lastSuccess:
+                freshness.append((labels(brand.key, cursor.platform.lower()),
+                                  round((current - cursor.lastSuccess).total_seconds(), 1)))
+
+    families = [
+        ("ingest_last_run_timestamp_seconds", "gauge", "When the last run of the stage finished.",
+         [(labels(run.brand, run.platform), run.storeTime.timestamp()) for run in runs]),
+        ("ingest_last_run_ok", "gauge", "1 if the last run of the stage succeeded.",
+         [(labels(run.brand, run.platform), int(run.ok)) for run in runs]),
+        ("ingest_last_run_seconds", "gauge", "Time spent in the last run, by phase.",
+         [(labels(run.brand, run.platform, phase=phase), round(getattr(run, field), 4)) for run in runs for phase, field in (
+             ("total", "elapsed"), ("fetch", "fetchSeconds"), ("download", "downloadSeconds"),
+             ("db", "dbSeconds"), ("parse", "parseSeconds"))]),
+        ("ingest_last_run_items", "gauge", "Items seen, created and updated by the last run.",
+         [(labels(run.brand, run.platform, kind=kind), getattr(run, kind)) for run in runs for kind in ("seen", "created", "updated")]),
+        ("ingest_last_run_queries", "gauge", "SQL queries issued by the last run.",
+         [(labels(run.brand, run.platform), run.queries) for run in runs]),
+        ("ingest_last_run_fetches", "gauge", "Upstream API requests made by the last run.",
+         [(labels(run.brand, run.platform), run.fetches) for run in runs]),
+        ("ingest_last_run_bytes", "gauge", "Media bytes downloaded by the last run.",
+         [(labels(run.brand, run.platform), run.bytes) for run in runs]),
+        ("ingest_last_run_errors", "gauge", "Failed downloads and exceptions in the last run.",
+         [(labels(run.brand, run.platform), run.errors) for run in runs]),
+        ("ingest_failed_runs", "gauge", "Failed runs still in the run log.",
+         [(labels(row["brand"], row["platform"]), row["count"]) for row in failures]),
+        ("ingest_freshness_seconds", "gauge", "Seconds since the stage last succeeded.",
+         freshness),
+        ("ingest_newest_item_timestamp_seconds", "gauge", "Publish time of the newest stored item.",
+         newest),
+        ("feed_page_cache_requests_total", "counter", "Feed pages served from the page cache or rendered.",
+         [({"brand": brand, "result": result}, count) for brand, result, count in pagecache.counters(BRANDS)]),
+    ]
+    return HttpResponse(exposition(families), content_type="text/plain; version=0.0.4; charset=utf-8")
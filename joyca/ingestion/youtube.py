@@ -0,0 +1,130 @@
+import io
+import xml.etree.ElementTree as ET
+from collections import namedtuple
+from datetime import datetime
+
+from decouple import config
+from django.db import transaction
+
+from .client import UpstreamError
+from .conditional import conditional_get, remember
+from . import metrics, pagecache, profiles
+from .cursors import advance, is_known, load_cursor
+from .upsert import stored_fingerprints, write
+from .utils import format_count
+
+FEED_URL = "https://www.youtube.com/feeds/videos.xml?channel_id={}"
+CHANNELS_URL = "https://www.googleapis.com/youtube/v3/channels?part={}&id={}&key={}"
+
+# Qualified tag names of the feed elements we read
+ATOM = '{http://www.w3.org/2005/Atom}'
+YT = '{http://www.youtube.com/xml/schemas/2015}'
+MEDIA = '{http://search.yahoo.com/mrss/}'
+
+FeedEntry = namedtuple("FeedEntry", ["videoID", "title", "published", "thumbnail", "views"])
+
+
+def iter_feed(content):
+    """
+    Yields one FeedEntry per <entry>, newest first, as soon as its closing
+    tag is parsed. Entries are cleared once read; stop iterating and the
+    rest of the document is never parsed.
+    """
+    entry = None
+    for event, elem in ET.iterparse(io.BytesIO(content), events=("start", "end")):
+        if event == "start":
+            if elem.tag == ATOM + "entry":
+                entry = {}
+            continue
+        if entry is None:
+            continue
+        tag = elem.tag
+        if tag == YT + "videoId":
+            entry["videoID"] = elem.text
+        elif tag == ATOM + "title":
+            entry["title"] = elem.text
+        elif tag == ATOM + "published":
+            entry["published"] = datetime.fromisoformat(elem.text)
+        elif tag == MEDIA + "thumbnail":
+            entry["thumbnail"] = elem.attrib["url"]
+        elif tag == MEDIA + "statistics":
+            entry["views"] = elem.attrib["views"]
+        elif tag == ATOM + "entry":
+            yield FeedEntry(**entry)
+            entry = None
+            elem.clear()
+
+
+def ingest_youtube(brand, full=False):
+    storeData = brand.model("storeData")
+    cursor = load_cursor(brand, "YouTube")
+    url = FEED_URL.format(brand.youtubeChannelID)
+    response = conditional_get(url)
+    if response.status_code == 304:
+        # feed unchanged since the last run, nothing to parse
+        advance(cursor)
+        return f'Status code: {response.status_code}'
+    if response.status_code != 200:
+        raise UpstreamError(f'Failed to fetch XML data. Status code: {response.status_code}')
+
+    # parse up to the watermark only; the entries behind it are already stored
+    entries = {}
+    for entry in iter_feed(response.content):
+        if is_known(cursor, entry.videoID, entry.published, full):
+            break
+        entries[entry.videoID] = entry
+    # one keyed lookup, then writes for the new videos and the ones that changed
+    stored = stored_fingerprints(storeData, "YouTube", entries)
+    rows = [storeData(
+        dataURL=url,
+        publishDateYT=videoData.published,
+        videoIdYT=videoData.videoID,
+        videoTitleYT=videoData.title,
+        viewsYT=int(videoData.views or 0),
+        thumbnailYT=videoData.thumbnail,
+        platform="YouTube",
+        channelNameYT=brand.displayName,
+        postKey=videoData.videoID,
+    ) for videoData in entries.values()]
+    with transaction.atomic():
+        created, updated = write(storeData, rows, ["dataURL", "videoTitleYT", "viewsYT", "thumbnailYT", "channelNameYT"],
+                                 stored, extra=["storeTime"])
+        if created or updated:
+            pagecache.changed(brand)
+        if entries:
+            newest = next(iter(entries.values()))
+            advance(cursor, newest.videoID, newest.published)
+        else:
+            advance(cursor)
+    remember(response)
+    metrics.current().items(len(entries), created, updated)
+    return f'Status code: {response.status_code} ({created} new, {updated} updated)'
+
+
+def ingest_banner(brand, full=False):
+    # no watermark, the row only records when the stage last succeeded
+    cursor = load_cursor(brand, "Banner")
+    youtubeBannerURL = CHANNELS_URL.format("brandingSettings", brand.youtubeChannelID, config("YT_API"))
+    response = conditional_get(youtubeBannerURL)
+    ytSubsCount = CHANNELS_URL.format("statistics", brand.youtubeChannelID, config("YT_API")) + "&fields=items/statistics/subscriberCount"
+    responseytSubsCount = conditional_get(ytSubsCount)
+
+    # a 304 on either call keeps the value already stored on the row
+    if response.status_code not in (200, 304) or responseytSubsCount.status_code not in (200, 304):
+        raise UpstreamError(f'Failed to fetch data. Status code: {response.status_code} {responseytSubsCount.status_code}')
+    if response.status_code == 304 and responseytSubsCount.status_code == 304:
+        advance(cursor)
+        return f'Status code: {response.status_code}'
+    banner = {"dpURL": brand.youtubeAvatar, "ytHandle": brand.displayName, "ytLink": brand.youtubeLink}
+    #youtubeBanner
+    if response.status_code == 200:
+        jsonRes  =response.json()
+        banner["dataURL"] = jsonRes["items"][0]["brandingSettings"]["image"]["bannerExternalUrl"]
+    #youtubeSubsCount
+    if responseytSubsCount.status_code == 200:
+        jsonRes =responseytSubsCount.json()
+        banner["subsCount"] = format_count(jsonRes["items"][0]["statistics"]["subscriberCount"])
+    profiles.store(brand, "bannerYT", **banner)
+    advance(cursor)
+    remember(response, responseytSubsCount)
+    return f'Status code: {response.status_code}'
@@ -12,7 +12,7 @@ https://docs.djangoproject.com/en/5.0/ref/settings/
 
 import os
 from pathlib import Path
-from decouple import config
+from decouple import Csv, config
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -42,6 +42,7 @@ INSTALLED_APPS = [
     'joycaHome.apps.JoycahomeConfig',
     'djilsiHome.apps.DjilsihomeConfig',
     'pannacotechHome.apps.PannacotechhomeConfig',
+    'ingestion.apps.IngestionConfig',
     'import_export',
     'multi_domains'
 ]
@@ -160,3 +161,71 @@ STATIC_URL = '/static/'
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+
+# Ingestion
+# Brands ingested side by side, and bounds for the concurrent media download stage.
+
+INGEST_BRAND_WORKERS = config('INGEST_BRAND_WORKERS', default=3, cast=int)
+INGEST_DOWNLOAD_WORKERS = config('INGEST_DOWNLOAD_WORKERS', default=8, cast=int)
+INGEST_DOWNLOAD_PER_HOST = config('INGEST_DOWNLOAD_PER_HOST', default=4, cast=int)
+
+# Shared HTTP client: connection pool per upstream host, retry/backoff for GETs.
+
+INGEST_HTTP_POOL_HOSTS = config('INGEST_HTTP_POOL_HOSTS', default=20, cast=int)
+INGEST_HTTP_POOL_SIZE = config('INGEST_HTTP_POOL_SIZE', default=10, cast=int)
+INGEST_HTTP_RETRIES = config('INGEST_HTTP_RETRIES', default=3, cast=int)
+INGEST_HTTP_BACKOFF = config('INGEST_HTTP_BACKOFF', default=0.5, cast=float)
+INGEST_HTTP_TIMEOUT = config('INGEST_HTTP_TIMEOUT', default=30, cast=int)
+
+# Instagram Graph API: posts requested per page when following the media cursors.
+
+INGEST_INSTAGRAM_PAGE_SIZE = config('INGEST_INSTAGRAM_PAGE_SIZE', default=25, cast=int)
+
+# Per-host pacing: token bucket refill rate (requests/s) and burst, halved and paused on
+# 429/5xx. INGEST_RATE_LIMITS overrides the rate for a host and its subdomains.
+
+INGEST_RATE_DEFAULT = config('INGEST_RATE_DEFAULT', default=5.0, cast=float)
+INGEST_RATE_BURST = config('INGEST_RATE_BURST', default=10, cast=int)
+INGEST_RATE_MAX_BACKOFF = config('INGEST_RATE_MAX_BACKOFF', default=300, cast=int)
+INGEST_RATE_LIMITS = {
+    "graph.facebook.com": 2.0,
+    "cdninstagram.com": 10.0,
+    "fbcdn.net": 10.0,
+    "nitter": 0.5,
+}
+
+# Days of IngestRun rows kept for the metrics endpoint.
+
+INGEST_RUN_RETENTION_DAYS = config('INGEST_RUN_RETENTION_DAYS', default=30, cast=int)
+
+# Nitter instance cache: how many ranked instances a run tries before re-probing,
+# ntscraper's retries per instance, and the failures in a row that drop an instance.
+
+INGEST_NITTER_ATTEMPTS = config('INGEST_NITTER_ATTEMPTS', default=3, cast=int)
+INGEST_NITTER_RETRIES = config('INGEST_NITTER_RETRIES', default=2, cast=int)
+INGEST_NITTER_MAX_FAILURES = config('INGEST_NITTER_MAX_FAILURES', default=3, cast=int)
+INGEST_NITTER_PROBE_TIMEOUT = config('INGEST_NITTER_PROBE_TIMEOUT', default=10, cast=int)
+
+# Responsive variants of Instagram images: target widths (px) and encoder processes.
+
+INGEST_IMAGE_WIDTHS = config('INGEST_IMAGE_WIDTHS', default='320,640,1080', cast=Csv(int))
+INGEST_IMAGE_WORKERS = config('INGEST_IMAGE_WORKERS', default=2, cast=int)
+
+# Rendered feed pages. File based by default so that `manage.py ingest` (cron) and the
+# web workers share one cache; pages are keyed on a per-brand version that ingests bump.
+
+CACHES = {
+    "default": {
+        "BACKEND": config('CACHE_BACKEND', default='django.core.cache.backends.filebased.FileBasedCache'),
+        "LOCATION": config('CACHE_LOCATION', default=os.path.join(BASE_DIR, "cache")),
+        "OPTIONS": {"MAX_ENTRIES": config('CACHE_MAX_ENTRIES', default=2000, cast=int)},
+    }
+}
+INGEST_PAGE_CACHE_TTL = config('INGEST_PAGE_CACHE_TTL', default=24 * 3600, cast=int)
+
+# Feed Cache-Control: browser max-age and shared (reverse proxy) s-maxage in seconds. Both
+# revalidate against the ETag/Last-Modified of the page version, answered with a 304.
+
+INGEST_FEED_MAX_AGE = config('INGEST_FEED_MAX_AGE', default=0, cast=int)
+INGEST_FEED_SHARED_MAX_AGE = config('INGEST_FEED_SHARED_MAX_AGE', default=300, cast=int)
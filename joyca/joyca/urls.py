@@ -2,9 +2,11 @@ from django.contrib import admin
 from django.urls import include, path
 from django.conf.urls.static import static
 from django.conf import settings
+from ingestion import views as ingestionViews
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('metrics-23-22aa-API-URL', ingestionViews.metrics, name="ingestMetrics"),
     path('', include("joycaHome.urls")),
 ]
 # urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
\ No newline at end of file
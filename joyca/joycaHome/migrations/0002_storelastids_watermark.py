@@ -0,0 +1,23 @@
+# Generated by Django 5.1.15 on 2026-10-18 12:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('joycaHome', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='storelastids',
+            name='lastPublished',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='storelastids',
+            name='lastSuccess',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
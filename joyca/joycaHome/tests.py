@@ -1,3 +1,40 @@
+from datetime import timedelta
+
 from django.test import TestCase
+from django.utils.timezone import now
+
+from .models import storeData
 
 # Create your tests here.
+
+
+class FeedIndexTests(TestCase):
+    """The feed and ingest queries are served by storeData's indexes, not table scans."""
+
+    @classmethod
+    def setUpTestData(cls):
+        published = now()
+        storeData.objects.bulk_create([
+            storeData(platform=platform, publishDateYT=published - timedelta(hours=index), postKey=f"{platform}-{index}")
+            for index in range(50) for platform in ("YouTube", "Instagram", "Twitter")
+        ])
+
+    def assertUsesIndex(self, queryset, *indexes):
+        plan = queryset.explain()
+        self.assertTrue(any(index in plan for index in indexes), plan)
+
+    def test_feed_uses_keyset_index(self):
+        self.assertUsesIndex(storeData.objects.order_by("-publishDateYT", "-sno")[:7], "joyca_feed_keyset_idx")
+
+    def test_platform_feed_uses_platform_index(self):
+        self.assertUsesIndex(storeData.objects.filter(platform="YouTube").order_by("-publishDateYT", "-sno")[:7],
+                             "joyca_platform_pub_idx")
+
+    def test_top_feed_uses_counter_index(self):
+        self.assertUsesIndex(storeData.objects.filter(platform="YouTube").order_by("-viewsYT", "-sno")[:7],
+                             "joyca_yt_views_idx")
+
+    def test_ingest_lookup_uses_post_key(self):
+        self.assertUsesIndex(storeData.objects.filter(platform="Twitter", postKey__in=["Twitter-1", "Twitter-2"]),
+                             # SQLite names the index behind a unique constraint itself
+                             "joyca_post_key_uniq", "sqlite_autoindex_joycaHome_storedata")
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.15 on 2026-10-18 12:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pannacotechHome', '0003_storedata_instamediavariants'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='storedata',
+            index=models.Index(fields=['publishDateYT', 'sno'], name='pannacotech_feed_keyset_idx'),
+        ),
+    ]
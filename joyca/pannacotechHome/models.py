@@ -10,6 +10,9 @@ class StoreLastIDs(models.Model):
     platform = models.CharField(max_length=255)
     lastID = models.CharField(max_length=255, blank=False)
     lastRun = models.DateTimeField(default=now)
+    # newest publish time already stored; ingesters stop once they reach it
+    lastPublished = models.DateTimeField(blank=True, null=True)
+    lastSuccess = models.DateTimeField(blank=True, null=True)
 
 class storeData(models.Model):
     sno = models.AutoField(primary_key=True)
@@ -22,29 +25,50 @@ class storeData(models.Model):
     dataURL = models.CharField(max_length=255)
     videoIdYT = models.CharField(max_length=255)
     videoTitleYT = models.CharField(max_length=255)
-    viewsYT = models.CharField(max_length=255)
+    # raw counts, formatted by the formatCount template filter
+    viewsYT = models.BigIntegerField(default=0)
     thumbnailYT = models.CharField(max_length=255)
     # InstaData
     instaThumbnailURL = models.TextField()
-    instaIsVideo = models.CharField(max_length=255)
+    instaIsVideo = models.BooleanField(default=False)
     instaVideoURL = models.TextField(blank=True,null=True)
     instaDesc = models.TextField()
     instaPostLink = models.TextField()
-    instaLikes = models.TextField()
+    instaLikes = models.BigIntegerField(default=0)
     instaPostID = models.CharField(max_length=255)
-    instaIsSingle = models.CharField(max_length=255)
+    instaIsSingle = models.BooleanField(default=False)
     instaMediaLinks = models.JSONField(blank=True, null=True)
+    # {link: {mime type: srcset}} for the images in instaMediaLinks
+    instaMediaVariants = models.JSONField(blank=True, null=True)
 
     #Twitter
     tweetText = models.TextField()
-    twitterLikes = models.CharField(max_length=255)
+    twitterLikes = models.BigIntegerField(default=0)
     tweetLink = models.TextField()
-    twitterIsVideo = models.CharField(max_length=255)
+    twitterIsVideo = models.BooleanField(default=False)
     twitterMediaURL = models.TextField()
     twitterPostID = models.CharField(max_length=255)
+    # the platform's own ID (videoIdYT, instaPostID or twitterPostID), unique per platform
+    postKey = models.CharField(max_length=64, blank=True, null=True)
+    # short hash per mutable field as of the last write, see ingestion.upsert.fingerprint
+    fingerprint = models.CharField(max_length=64, blank=True, default="")
     def __str__(self):
         return f"{self.sno} - {self.platform}"
 
+    class Meta:
+        indexes = [
+            # keyset pagination order of the feeds
+            models.Index(fields=["publishDateYT", "sno"], name="pannacotech_feed_keyset_idx"),
+            models.Index(fields=["platform", "publishDateYT"], name="pannacotech_platform_pub_idx"),
+            # top posts feeds
+            models.Index(fields=["platform", "viewsYT"], name="pannacotech_yt_views_idx"),
+            models.Index(fields=["platform", "instaLikes"], name="pannacotech_insta_likes_idx"),
+            models.Index(fields=["platform", "twitterLikes"], name="pannacotech_tw_likes_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=["platform", "postKey"], name="pannacotech_post_key_uniq"),
+        ]
+
 class bannerYT(models.Model):
     sno = models.AutoField(primary_key=True)
     storeTime = models.DateTimeField(default=now)
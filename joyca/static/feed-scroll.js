@@ -0,0 +1,42 @@
+// Loads the next batch of feed cards as the reader nears the end of the list.
+// The server renders each batch as a fragment (feed_batch.html) that carries
+// the cursor of the batch after it; an empty cursor ends the feed.
+(function () {
+  var posts = document.querySelector(".posts");
+  // a single page feed has nothing to load
+  if (!posts || !posts.dataset.cardsUrl || !posts.dataset.nextCursor) {
+    return;
+  }
+  var nextCursor = posts.dataset.nextCursor;
+
+  // video.js and Splide only set up what was in the page when it loaded
+  function mount(items) {
+    items.forEach(function (item) {
+      item.querySelectorAll(".video-js").forEach(function (video) {
+        videojs(video);
+      });
+      item.querySelectorAll(".splide").forEach(function (carousel) {
+        new Splide(carousel).mount();
+      });
+    });
+  }
+
+  var infScroll = new InfiniteScroll(posts, {
+    path: function () {
+      if (nextCursor) {
+        return posts.dataset.cardsUrl + "?cursor=" + encodeURIComponent(nextCursor);
+      }
+    },
+    append: ".feed-batch > *",
+    history: false,
+    scrollThreshold: 600,
+  });
+
+  infScroll.on("load", function (body) {
+    var batch = body.querySelector(".feed-batch");
+    nextCursor = batch ? batch.dataset.nextCursor : "";
+  });
+  infScroll.on("append", function (body, path, items) {
+    mount(items);
+  });
+})();